@@ -5,17 +5,15 @@
 
 import { API, MODELS, RESPONSE_FORMATS, TEMPERATURE, IMAGE_CONFIG } from './constants.js';
 
-/**
- * Generate a rich, realistic scenario for a Dutch conversation.
- * Uses two API calls: one for creative generation, one for JSON formatting.
- */
-export async function generateScenario(apiKey, char1Name, char2Name) {
-    // Step 1: Creative generation without JSON constraints
-    const creativePrompt = `You are a creative writer helping design scenarios for Dutch language learning.
+// Static instructions live in system messages and per-request details (names,
+// scenario text) in user messages, so OpenAI's prompt caching can reuse the
+// stable prefix across requests instead of re-processing it every time.
+
+const SCENARIO_SYSTEM_PROMPT = `You are a creative writer helping design scenarios for Dutch language learning.
 
 Generate a rich, realistic everyday scenario that someone living in Utrecht, Netherlands might encounter. This person is a professional with a family - they're active, social, and engaged in their community.
 
-Create ONE scenario involving exactly two people: ${char1Name} and ${char2Name}.
+Create ONE scenario involving exactly the two people named by the user.
 
 CRITICAL: You MUST choose from the FULL range of situations below. DO NOT default to markets, gardens, or cafes. Pick something UNEXPECTED:
 
@@ -72,6 +70,23 @@ Write a vivid paragraph (4-6 sentences) describing:
 
 Be creative and SPECIFIC. AVOID: generic coffee ordering, farmers markets, gardens, and bike shops (overused). Make it feel like a real slice of Dutch life with texture and personality.`;
 
+const STRUCTURE_SYSTEM_PROMPT = `Extract the following information from the scenario description provided by the user and return it as valid JSON.
+
+Return this exact JSON structure:
+{
+  "scenario_description": "the full scenario description as written",
+  "setting_type": "one or two word category like 'neighborhood', 'school', 'cafe', 'gym', 'market', etc.",
+  "mood": "one or two word mood like 'friendly', 'slightly awkward', 'hurried', 'warm', 'tense', etc.",
+  "character1_role": "brief role description for the first character",
+  "character2_role": "brief role description for the second character"
+}`;
+
+/**
+ * Generate a rich, realistic scenario for a Dutch conversation.
+ * Uses two API calls: one for creative generation, one for JSON formatting.
+ */
+export async function generateScenario(apiKey, char1Name, char2Name) {
+    // Step 1: Creative generation without JSON constraints
     const creativeResponse = await fetch(`${API.BASE_URL}${API.ENDPOINTS.CHAT_COMPLETIONS}`, {
         method: 'POST',
         headers: {
@@ -80,7 +95,10 @@ Be creative and SPECIFIC. AVOID: generic coffee ordering, farmers markets, garde
         },
         body: JSON.stringify({
             model: MODELS.CHAT,
-            messages: [{ role: 'user', content: creativePrompt }],
+            messages: [
+                { role: 'system', content: SCENARIO_SYSTEM_PROMPT },
+                { role: 'user', content: `The two people: ${char1Name} and ${char2Name}.` }
+            ],
             temperature: TEMPERATURE.CREATIVE
         })
     });
@@ -94,19 +112,11 @@ Be creative and SPECIFIC. AVOID: generic coffee ordering, farmers markets, garde
     const rawScenario = creativeData.choices[0].message.content;
 
     // Step 2: Transform to structured JSON
-    const structurePrompt = `Extract the following information from this scenario description and return it as valid JSON:
-
-SCENARIO:
+    const structureUserPrompt = `SCENARIO:
 ${rawScenario}
 
-Return this exact JSON structure:
-{
-  "scenario_description": "the full scenario description as written above",
-  "setting_type": "one or two word category like 'neighborhood', 'school', 'cafe', 'gym', 'market', etc.",
-  "mood": "one or two word mood like 'friendly', 'slightly awkward', 'hurried', 'warm', 'tense', etc.",
-  "character1_role": "brief role description for ${char1Name}",
-  "character2_role": "brief role description for ${char2Name}"
-}`;
+Character 1: ${char1Name}
+Character 2: ${char2Name}`;
 
     const structureResponse = await fetch(`${API.BASE_URL}${API.ENDPOINTS.CHAT_COMPLETIONS}`, {
         method: 'POST',
@@ -116,7 +126,10 @@ Return this exact JSON structure:
         },
         body: JSON.stringify({
             model: MODELS.CHAT,
-            messages: [{ role: 'user', content: structurePrompt }],
+            messages: [
+                { role: 'system', content: STRUCTURE_SYSTEM_PROMPT },
+                { role: 'user', content: structureUserPrompt }
+            ],
             response_format: RESPONSE_FORMATS.JSON,
             temperature: TEMPERATURE.DETERMINISTIC
         })
@@ -131,17 +144,9 @@ Return this exact JSON structure:
     return JSON.parse(structureData.choices[0].message.content);
 }
 
-/**
- * Generate a conversation outline for focused, coherent dialogue.
- * Stage 1 of 2 in script generation.
- */
-async function generateConversationOutline(apiKey, char1Name, char2Name, scenarioDescription) {
-    const outlinePrompt = `You are planning a short, focused Dutch conversation for language learners.
-
-SCENARIO:
-${scenarioDescription}
+const OUTLINE_SYSTEM_PROMPT = `You are planning a short, focused Dutch conversation for language learners.
 
-Plan a coherent 4-6 line conversation between ${char1Name} and ${char2Name}.
+Plan a coherent 4-6 line conversation between the two speakers named by the user.
 
 IMPORTANT RULES:
 - Choose ONE main topic from the scenario (don't try to cover everything)
@@ -149,23 +154,34 @@ IMPORTANT RULES:
 - Keep it simple and focused - this is for A1 learners
 
 Plan the conversation structure:
-1. OPENING: How does the first person start? (greeting + initial question/comment)
-2. RESPONSE: How does the second person respond to EXACTLY what was said?
-3. FOLLOW-UP: First person responds to that answer (stay on same topic!)
-4. CONTINUATION: Second person continues the same thread
+1. OPENING: How does the first speaker start? (greeting + initial question/comment)
+2. RESPONSE: How does the second speaker respond to EXACTLY what was said?
+3. FOLLOW-UP: First speaker responds to that answer (stay on same topic!)
+4. CONTINUATION: Second speaker continues the same thread
 5. CLOSING: Natural wrap-up related to what was discussed
 
 Return JSON:
 {
   "main_topic": "the single topic this conversation focuses on",
-  "opening_intent": "what ${char1Name} wants to say/ask",
-  "response_intent": "how ${char2Name} directly answers/responds",
-  "followup_intent": "how ${char1Name} continues on the SAME topic",
-  "continuation_intent": "how ${char2Name} builds on that",
+  "opening_intent": "what the first speaker wants to say/ask",
+  "response_intent": "how the second speaker directly answers/responds",
+  "followup_intent": "how the first speaker continues on the SAME topic",
+  "continuation_intent": "how the second speaker builds on that",
   "closing_intent": "how they wrap up (goodbye, thanks, see you later, etc.)",
   "situation_summary": "1 sentence description for the learner (in English)"
 }`;
 
+/**
+ * Generate a conversation outline for focused, coherent dialogue.
+ * Stage 1 of 2 in script generation.
+ */
+async function generateConversationOutline(apiKey, char1Name, char2Name, scenarioDescription) {
+    const outlineUserPrompt = `SCENARIO:
+${scenarioDescription}
+
+First speaker: ${char1Name}
+Second speaker: ${char2Name}`;
+
     const response = await fetch(`${API.BASE_URL}${API.ENDPOINTS.CHAT_COMPLETIONS}`, {
         method: 'POST',
         headers: {
@@ -174,7 +190,10 @@ Return JSON:
         },
         body: JSON.stringify({
             model: MODELS.CHAT,
-            messages: [{ role: 'user', content: outlinePrompt }],
+            messages: [
+                { role: 'system', content: OUTLINE_SYSTEM_PROMPT },
+                { role: 'user', content: outlineUserPrompt }
+            ],
             response_format: RESPONSE_FORMATS.JSON,
             temperature: TEMPERATURE.BALANCED
         })
@@ -189,28 +208,12 @@ Return JSON:
     return JSON.parse(data.choices[0].message.content);
 }
 
-/**
- * Generate the actual dialogue from an outline.
- * Stage 2 of 2 in script generation.
- */
-async function generateDialogueFromOutline(apiKey, char1, char2, outline) {
-    const dialoguePrompt = `You are a Dutch language teacher writing A1 level dialogue.
-
-CONVERSATION PLAN:
-- Topic: ${outline.main_topic}
-- Setting: ${outline.situation_summary}
-
-LINE-BY-LINE PLAN:
-1. ${char1.name}: ${outline.opening_intent}
-2. ${char2.name}: ${outline.response_intent}
-3. ${char1.name}: ${outline.followup_intent}
-4. ${char2.name}: ${outline.continuation_intent}
-5. One or both: ${outline.closing_intent}
+const DIALOGUE_SYSTEM_PROMPT = `You are a Dutch language teacher writing A1 level dialogue.
 
-Write this conversation in Dutch (A1 level) following the plan EXACTLY.
+The user provides a conversation plan. Write that conversation in Dutch (A1 level) following the plan EXACTLY.
 
 CRITICAL RULES:
-- Each line MUST follow the plan above
+- Each line MUST follow the plan
 - Each line MUST directly respond to what was just said
 - Do NOT add new topics or information not in the plan
 - Use simple present tense and basic A1 vocabulary
@@ -224,11 +227,10 @@ Also create 4 comprehension questions:
 
 Return JSON:
 {
-  "situation": "${outline.situation_summary}",
-  "characters": ["${char1.name}", "${char2.name}"],
+  "situation": "the situation summary exactly as given in the plan",
+  "characters": ["first speaker name", "second speaker name"],
   "dialogue": [
-    {"speaker": "${char1.name}", "text": "Dutch text", "translation": "English translation", "voice_id": ${char1.voice_id}},
-    {"speaker": "${char2.name}", "text": "Dutch text", "translation": "English translation", "voice_id": ${char2.voice_id}}
+    {"speaker": "speaker name", "text": "Dutch text", "translation": "English translation", "voice_id": "the speaker's voice_id from the plan"}
   ],
   "questions": [
     {
@@ -239,6 +241,26 @@ Return JSON:
   ]
 }`;
 
+/**
+ * Generate the actual dialogue from an outline.
+ * Stage 2 of 2 in script generation.
+ */
+async function generateDialogueFromOutline(apiKey, char1, char2, outline) {
+    const dialogueUserPrompt = `CONVERSATION PLAN:
+- Topic: ${outline.main_topic}
+- Setting: ${outline.situation_summary}
+
+SPEAKERS:
+- ${char1.name} (voice_id: ${char1.voice_id})
+- ${char2.name} (voice_id: ${char2.voice_id})
+
+LINE-BY-LINE PLAN:
+1. ${char1.name}: ${outline.opening_intent}
+2. ${char2.name}: ${outline.response_intent}
+3. ${char1.name}: ${outline.followup_intent}
+4. ${char2.name}: ${outline.continuation_intent}
+5. One or both: ${outline.closing_intent}`;
+
     const response = await fetch(`${API.BASE_URL}${API.ENDPOINTS.CHAT_COMPLETIONS}`, {
         method: 'POST',
         headers: {
@@ -247,7 +269,10 @@ Return JSON:
         },
         body: JSON.stringify({
             model: MODELS.CHAT,
-            messages: [{ role: 'user', content: dialoguePrompt }],
+            messages: [
+                { role: 'system', content: DIALOGUE_SYSTEM_PROMPT },
+                { role: 'user', content: dialogueUserPrompt }
+            ],
             response_format: RESPONSE_FORMATS.JSON,
             temperature: TEMPERATURE.FOCUSED
         })
@@ -278,16 +303,28 @@ export async function generateScript(apiKey, char1, char2, scenarioDescription)
     // Stage 2: Generate dialogue from outline
     const script = await generateDialogueFromOutline(apiKey, char1, char2, outline);
 
-    // Post-process: Ensure voice_ids match speakers (LLM may not follow instructions)
-    const voiceMap = {
-        [char1.name]: char1.voice_id,
-        [char2.name]: char2.voice_id
-    };
-
-    script.dialogue = script.dialogue.map(line => ({
-        ...line,
-        voice_id: voiceMap[line.speaker] ?? char1.voice_id
-    }));
+    // Post-process: the LLM may drift on speaker labels (casing, stray
+    // whitespace, or an invented third speaker), which would scramble voice
+    // assignment and the transcript. Coerce every line to one of the two
+    // known characters so names and voice_ids stay deterministic.
+    const normalizeName = name => String(name).trim().toLowerCase();
+    const charactersByName = new Map([
+        [normalizeName(char1.name), char1],
+        [normalizeName(char2.name), char2]
+    ]);
+
+    script.dialogue = script.dialogue.map((line, index) => {
+        // Unrecognized speakers fall back by line parity, matching the
+        // alternating structure of the planned conversation
+        const character = charactersByName.get(normalizeName(line.speaker))
+            ?? (index % 2 === 0 ? char1 : char2);
+
+        return {
+            ...line,
+            speaker: character.name,
+            voice_id: character.voice_id
+        };
+    });
 
     return script;
 }
@@ -11,8 +11,10 @@ import {
   , STORAGE_KEYS
   , API_KEY_PREFIX
   , AUDIO
+  , PROMPT_VERSION
   , VOICE_MAP
-  , CHARACTERS
+  , FEMALE_CHARACTERS
+  , MALE_CHARACTERS
   , UI_STATES
   , QUIZ
 } from './constants.js';
@@ -98,7 +100,57 @@ async function validateApiKey(key) {
 // OPENAI API CALLS
 // ============================================================================
 
+// In-memory cache of TTS audio blobs keyed by voice + text, so repeated lines
+// (common A1 phrases like "Goedendag" or "Dank je wel") skip the API entirely.
+// Blobs are cached rather than blob URLs, since URLs get revoked between scenarios.
+const audioBlobCache = new Map();
+let audioCacheBytes = 0;
+
+// In-flight TTS requests keyed like the blob cache, so duplicate lines
+// dispatched concurrently (Promise.all over the dialogue) hit the API once
+const pendingAudioRequests = new Map();
+
+function audioCacheKey(text, voiceId) {
+    return `${voiceId}|${text}`;
+}
+
+function cacheAudioBlob(key, blob) {
+    if (audioBlobCache.has(key)) return;
+
+    audioBlobCache.set(key, blob);
+    audioCacheBytes += blob.size;
+
+    // Evict least-recently-used entries until back under the byte budget
+    for (const [oldKey, oldBlob] of audioBlobCache) {
+        if (audioCacheBytes <= AUDIO.CACHE_MAX_BYTES || oldKey === key) break;
+        audioBlobCache.delete(oldKey);
+        audioCacheBytes -= oldBlob.size;
+    }
+}
+
 async function generateAudio(text, voiceId) {
+    const cacheKey = audioCacheKey(text, voiceId);
+    const cachedBlob = audioBlobCache.get(cacheKey);
+    if (cachedBlob) {
+        // Re-insert so Map iteration order tracks least-recently-used
+        audioBlobCache.delete(cacheKey);
+        audioBlobCache.set(cacheKey, cachedBlob);
+        return URL.createObjectURL(cachedBlob);
+    }
+
+    let pending = pendingAudioRequests.get(cacheKey);
+    if (!pending) {
+        pending = fetchAudioBlob(text, voiceId)
+            .finally(() => pendingAudioRequests.delete(cacheKey));
+        pendingAudioRequests.set(cacheKey, pending);
+    }
+
+    const audioBlob = await pending;
+    cacheAudioBlob(cacheKey, audioBlob);
+    return URL.createObjectURL(audioBlob);
+}
+
+async function fetchAudioBlob(text, voiceId) {
     const voice = VOICE_MAP[voiceId] || VOICE_MAP[0];
 
     const response = await fetch(`${API.BASE_URL}${API.ENDPOINTS.AUDIO_SPEECH}`, {
@@ -111,7 +163,7 @@ async function generateAudio(text, voiceId) {
             model: MODELS.TTS,
             voice: voice,
             input: text,
-            response_format: RESPONSE_FORMATS.MP3,
+            response_format: RESPONSE_FORMATS.OPUS,
             speed: AUDIO.TTS_SPEED
         })
     });
@@ -120,8 +172,7 @@ async function generateAudio(text, voiceId) {
         throw new Error('TTS generation failed');
     }
 
-    const audioBlob = await response.blob();
-    return URL.createObjectURL(audioBlob);
+    return response.blob();
 }
 
 // ============================================================================
@@ -129,12 +180,9 @@ async function generateAudio(text, voiceId) {
 // ============================================================================
 
 function selectRandomCharacters() {
-    // Shuffle and pick one female and one male for voice variety
-    const females = CHARACTERS.filter(c => c.gender === 'F');
-    const males = CHARACTERS.filter(c => c.gender === 'M');
-
-    const female = females[Math.floor(Math.random() * females.length)];
-    const male = males[Math.floor(Math.random() * males.length)];
+    // Pick one female and one male for voice variety
+    const female = FEMALE_CHARACTERS[Math.floor(Math.random() * FEMALE_CHARACTERS.length)];
+    const male = MALE_CHARACTERS[Math.floor(Math.random() * MALE_CHARACTERS.length)];
 
     // Randomly decide who speaks first
     return Math.random() < 0.5 ? [female, male] : [male, female];
@@ -173,6 +221,20 @@ async function generateNewScenario() {
         const scenario = await generateScenario(state.apiKey, char1.name, char2.name);
         console.log('Scenario generated:', scenario);
 
+        // Start the scene illustration immediately - it only depends on the
+        // scenario, so it can render while the script is still being written
+        const sceneImagePromise = generateSceneImage(
+            state.apiKey
+          , scenario.setting_type
+          , scenario.mood
+          , scenario.scenario_description
+          , char1
+          , char2
+        ).catch(err => {
+            console.warn('Scene image generation failed:', err);
+            return null;  // Non-fatal: continue without image
+        });
+
         // Generate script based on scenario (two-stage: outline then dialogue)
         elements.statusMessage.textContent = 'Planning conversation...';
         const script = await generateScript(state.apiKey, char1, char2, scenario.scenario_description);
@@ -180,26 +242,14 @@ async function generateNewScenario() {
 
         state.currentScript = script;
 
-        // Generate audio and scene image in parallel
+        // Generate audio for all dialogue lines while the image finishes
         elements.statusMessage.textContent = 'Generating audio and scene illustration...';
 
         const [audioUrls, sceneImageUrl] = await Promise.all([
-            // Generate audio for all dialogue lines
             Promise.all(
                 script.dialogue.map(line => generateAudio(line.text, line.voice_id))
             )
-            // Generate scene illustration
-          , generateSceneImage(
-                state.apiKey
-              , scenario.setting_type
-              , scenario.mood
-              , scenario.scenario_description
-              , char1
-              , char2
-            ).catch(err => {
-                console.warn('Scene image generation failed:', err);
-                return null;  // Non-fatal: continue without image
-            })
+          , sceneImagePromise
         ]);
 
         state.currentAudioUrls = audioUrls;
@@ -257,9 +307,6 @@ function clearSceneImage() {
  * Generate a scenario in the background and cache it
  */
 async function generateAndCacheScenario() {
-    // DISABLED: Caching temporarily disabled for testing prompt changes
-    return;
-
     if (state.isBackgroundGenerating || !state.apiKey) {
         return;
     }
@@ -287,26 +334,29 @@ async function generateAndCacheScenario() {
         const scenario = await generateScenario(state.apiKey, char1.name, char2.name);
         console.log('[Background] Scenario generated');
 
+        // Start the scene illustration immediately so it overlaps script generation
+        const sceneImagePromise = generateSceneImage(
+            state.apiKey,
+            scenario.setting_type,
+            scenario.mood,
+            scenario.scenario_description,
+            char1,
+            char2
+        ).catch(err => {
+            console.warn('[Background] Scene image generation failed:', err);
+            return null;
+        });
+
         // Generate script
         const script = await generateScript(state.apiKey, char1, char2, scenario.scenario_description);
         console.log('[Background] Script generated');
 
-        // Generate audio and scene image in parallel
+        // Generate audio for all dialogue lines while the image finishes
         const [audioUrls, sceneImageUrl] = await Promise.all([
             Promise.all(
                 script.dialogue.map(line => generateAudio(line.text, line.voice_id))
             ),
-            generateSceneImage(
-                state.apiKey,
-                scenario.setting_type,
-                scenario.mood,
-                scenario.scenario_description,
-                char1,
-                char2
-            ).catch(err => {
-                console.warn('[Background] Scene image generation failed:', err);
-                return null;
-            })
+            sceneImagePromise
         ]);
 
         console.log('[Background] Audio and image generated');
@@ -332,7 +382,8 @@ async function generateAndCacheScenario() {
             script,
             audioBlobs,
             imageBlob,
-            characters: [char1.name, char2.name]
+            characters: [char1.name, char2.name],
+            promptVersion: PROMPT_VERSION
         });
 
         console.log('[Background] Scenario cached successfully');
@@ -349,9 +400,6 @@ async function generateAndCacheScenario() {
  * @returns {Promise<boolean>} True if loaded from cache, false otherwise
  */
 async function loadFromCache() {
-    // DISABLED: Caching temporarily disabled for testing prompt changes
-    return false;
-
     try {
         const cached = await getCachedScenario();
 
@@ -359,11 +407,17 @@ async function loadFromCache() {
             return false;
         }
 
+        // Scenarios generated with older prompts are stale - regenerate instead
+        if (cached.promptVersion !== PROMPT_VERSION) {
+            console.log('Discarding cached scenario from an older prompt version');
+            return false;
+        }
+
         console.log('Loading scenario from cache...');
 
         // Convert ArrayBuffers back to blob URLs
         const audioUrls = cached.audioBlobs.map(
-            buffer => arrayBufferToBlobUrl(buffer, 'audio/mpeg')
+            buffer => arrayBufferToBlobUrl(buffer, AUDIO.MIME_TYPE)
         );
 
         let sceneImageUrl = null;
@@ -621,7 +675,9 @@ function displayCurrentQuestion() {
     // Store the shuffled position of the correct answer
     state.shuffledCorrectIndex = shuffledIndices.indexOf(question.correct_answer);
 
-    // Display options in shuffled order
+    // Display options in shuffled order, built off-DOM so the live document
+    // is touched once instead of once per option
+    const optionsFragment = document.createDocumentFragment();
     shuffledIndices.forEach((originalIndex, displayIndex) => {
         const optionDiv = document.createElement('div');
         optionDiv.className = 'quiz-option';
@@ -629,8 +685,9 @@ function displayCurrentQuestion() {
         optionDiv.dataset.index = displayIndex;
         optionDiv.dataset.originalIndex = originalIndex;
         optionDiv.addEventListener('click', () => handleAnswerSelection(displayIndex));
-        elements.quizOptions.appendChild(optionDiv);
+        optionsFragment.appendChild(optionDiv);
     });
+    elements.quizOptions.appendChild(optionsFragment);
 
     // Hide feedback and next button
     elements.quizFeedback.style.display = 'none';
@@ -734,6 +791,9 @@ function toggleTranscript() {
 function populateTranscript() {
     elements.transcriptContent.innerHTML = '';
 
+    // Build all lines in a fragment and attach them in one DOM update
+    const fragment = document.createDocumentFragment();
+
     state.currentScript.dialogue.forEach((line) => {
         const lineDiv = document.createElement('div');
         lineDiv.className = 'transcript-line';
@@ -772,8 +832,10 @@ function populateTranscript() {
         lineDiv.appendChild(dutchSide);
         lineDiv.appendChild(englishSide);
 
-        elements.transcriptContent.appendChild(lineDiv);
+        fragment.appendChild(lineDiv);
     });
+
+    elements.transcriptContent.appendChild(fragment);
 }
 
 // ============================================================================
@@ -970,6 +1032,14 @@ function init() {
         hideApiKeyModal();
         setUIState(UI_STATES.INITIAL);
 
+        // Warm the API connection in the background while the user reads the
+        // start screen; also surfaces a revoked key before the first generation
+        validateApiKey(state.apiKey).then(isValid => {
+            if (!isValid) {
+                console.warn('Stored API key failed validation');
+            }
+        });
+
         // Initialize IndexedDB
         openDatabase().catch(err => {
             console.warn('Failed to open IndexedDB:', err);
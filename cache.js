@@ -49,6 +49,7 @@ export async function openDatabase() {
  * @param {ArrayBuffer[]} scenario.audioBlobs - Audio data for each line
  * @param {ArrayBuffer|null} scenario.imageBlob - Scene image data
  * @param {string[]} scenario.characters - Character names
+ * @param {number} scenario.promptVersion - Prompt version the script was generated with
  * @returns {Promise<void>}
  */
 export async function saveCachedScenario(scenario) {
@@ -64,6 +65,7 @@ export async function saveCachedScenario(scenario) {
             audioBlobs: scenario.audioBlobs,
             imageBlob: scenario.imageBlob,
             characters: scenario.characters,
+            promptVersion: scenario.promptVersion,
             createdAt: Date.now()
         };
 
@@ -28,9 +28,13 @@ export const IMAGE_CONFIG = {
   , QUALITY: 'low'  // 'low' (~$0.017), 'medium' (~$0.05), 'high' (~$0.15)
 };
 
+// Bump whenever the prompts in api.js change, so cached scenarios generated
+// with older prompts are discarded instead of served
+export const PROMPT_VERSION = 3;
+
 export const RESPONSE_FORMATS = {
     JSON: { type: 'json_object' }
-  , MP3: 'mp3'
+  , OPUS: 'opus'  // Voice-optimized codec, ~3x smaller than mp3 for TTS speech
 };
 
 // Temperature settings for different API call types
@@ -58,6 +62,8 @@ export const API_KEY_PREFIX = 'sk-';
 export const AUDIO = {
     PAUSE_BETWEEN_LINES_MS: 500
   , TTS_SPEED: 0.90
+  , MIME_TYPE: 'audio/ogg'  // Opus in an Ogg container
+  , CACHE_MAX_BYTES: 20 * 1024 * 1024  // Byte budget for the in-memory TTS cache
 };
 
 // Voice mapping for TTS (OpenAI voices)
@@ -81,6 +87,10 @@ export const CHARACTERS = [
   , { name: 'David', gender: 'M', voice_id: 1, appearance: 'athletic man in his mid-30s with dark curly hair' }
 ];
 
+// Precomputed gender partitions so character selection doesn't re-filter per call
+export const FEMALE_CHARACTERS = CHARACTERS.filter(c => c.gender === 'F');
+export const MALE_CHARACTERS = CHARACTERS.filter(c => c.gender === 'M');
+
 // ============================================================================
 // UI STATES
 // ============================================================================
@@ -11,7 +11,7 @@
  */
 
 import { generateScenario, generateScript } from './api.js';
-import { CHARACTERS } from './constants.js';
+import { FEMALE_CHARACTERS, MALE_CHARACTERS } from './constants.js';
 
 const API_KEY = process.env.OPENAI_API_KEY;
 
@@ -52,10 +52,8 @@ function validateScenario(scenario, char1Name, char2Name) {
 }
 
 async function runScenarioTest(testNum) {
-    const females = CHARACTERS.filter(c => c.gender === 'F');
-    const males = CHARACTERS.filter(c => c.gender === 'M');
-    const char1 = females[Math.floor(Math.random() * females.length)];
-    const char2 = males[Math.floor(Math.random() * males.length)];
+    const char1 = FEMALE_CHARACTERS[Math.floor(Math.random() * FEMALE_CHARACTERS.length)];
+    const char2 = MALE_CHARACTERS[Math.floor(Math.random() * MALE_CHARACTERS.length)];
 
     console.log(`\n${'='.repeat(70)}`);
     console.log(`SCENARIO TEST ${testNum}: ${char1.name} and ${char2.name}`);
@@ -90,10 +88,8 @@ async function runScenarioTest(testNum) {
 }
 
 async function runEndToEndTest(testNum) {
-    const females = CHARACTERS.filter(c => c.gender === 'F');
-    const males = CHARACTERS.filter(c => c.gender === 'M');
-    const char1 = females[Math.floor(Math.random() * females.length)];
-    const char2 = males[Math.floor(Math.random() * males.length)];
+    const char1 = FEMALE_CHARACTERS[Math.floor(Math.random() * FEMALE_CHARACTERS.length)];
+    const char2 = MALE_CHARACTERS[Math.floor(Math.random() * MALE_CHARACTERS.length)];
 
     console.log(`\n${'='.repeat(70)}`);
     console.log(`END-TO-END TEST ${testNum}: ${char1.name} and ${char2.name}`);